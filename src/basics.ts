@@ -1,3 +1,54 @@
+// Carve the 1-9 timed lava path from the bottom-left spawn, going up or right at random
+const carveTimedPath = (MAP: string[], topRow: number): string[] => {
+  const rows = MAP.map(row => row.split(''))
+  const W = MAP[0].length
+  let row = MAP.length - 2
+  let col = 2
+  for (let i = 1; i <= 9; i++) {
+    const up = row === topRow ? false : col === W - 2 ? true : Math.random() < 0.5
+    if (up) row--
+    else col++
+    rows[row][col] = String(i)
+  }
+  return rows.map(cells => cells.join(''))
+}
+
+// Random layouts are generated once, on first use; restarts just pick one from the pool
+const LAYOUT_POOL_SIZE = 8
+const pooled = (generate: () => string[]) => {
+  let pool: string[][] | null = null
+  return () => {
+    pool ??= Array.from({ length: LAYOUT_POOL_SIZE }, generate)
+    return pool[Math.floor(Math.random() * pool.length)]
+  }
+}
+
+const randomLayout = pooled(() => carveTimedPath([
+  "##########",
+  "#~~~~~~~E#",
+  "#~~~~~~~~#",
+  "#~~~~~~~~#",
+  "#~~~~~~~~#",
+  "#St~~~~~~#",
+  "##########",
+], 1))
+
+const integrationLayout = pooled(() => carveTimedPath([
+  "##########",
+  "#......a.#",
+  "#.######y#",
+  "#.K#...d.#",
+  "####B###.#",
+  "#E.~.....#",
+  "#~~~~~~~.#",
+  "#~~~~~~~.#",
+  "#~~~~~~~~#",
+  "#~~~~~~~~#",
+  "#~~~~~~~~#",
+  "#St~~~~~~#",
+  "##########",
+], 7))
+
 export const levels: Record<string, () => { MAP: string[], TIME_MS?: number }> = {
   intro: () => ({
     MAP: [
@@ -52,53 +103,12 @@ export const levels: Record<string, () => { MAP: string[], TIME_MS?: number }> =
       "###############",
     ],
   }),
-  random: () => {
-    const MAP = [
-      "##########",
-      "#~~~~~~~E#",
-      "#~~~~~~~~#",
-      "#~~~~~~~~#",
-      "#~~~~~~~~#",
-      "#St~~~~~~#",
-      "##########",
-    ]
-    let index = [MAP.length - 2, 2]
-    for (const i of Array.from({ length: 9 }, (_, i) => i + 1)) {
-      const dir = index[0] == 1 ? 1 : index[1] == MAP[0].length - 2 ? 0 : Math.random() < 0.5 ? 0 : 1
-      index[dir] += dir ? 1 : -1
-      MAP[index[0]] = MAP[index[0]].substring(0, index[1]) + i + MAP[index[0]].substring(index[1] + 1)
-    }
-    return {
-      MAP,
-      TIME_MS: 10000
-    }
-  },
-  integration: () => {
-    const MAP = [
-      "##########",
-      "#......a.#",
-      "#.######y#",
-      "#.K#...d.#",
-      "####B###.#",
-      "#E.~.....#",
-      "#~~~~~~~.#",
-      "#~~~~~~~.#",
-      "#~~~~~~~~#",
-      "#~~~~~~~~#",
-      "#~~~~~~~~#",
-      "#St~~~~~~#",
-      "##########",
-    ]
-    let index = [MAP.length - 2, 2]
-    for (const i of Array.from({ length: 9 }, (_, i) => i + 1)) {
-      const dir = index[0] == 7 ? 1 : index[1] == MAP[0].length - 2 ? 0 : Math.random() < 0.5 ? 0 : 1
-      index[dir] += dir ? 1 : -1
-      MAP[index[0]] = MAP[index[0]].substring(0, index[1]) + i + MAP[index[0]].substring(index[1] + 1)
-    }
-    return {
-      MAP,
-      TIME_MS: 10000
-    }
-
-  }
+  random: () => ({
+    MAP: randomLayout(),
+    TIME_MS: 10000
+  }),
+  integration: () => ({
+    MAP: integrationLayout(),
+    TIME_MS: 10000
+  }),
 }
\ No newline at end of file
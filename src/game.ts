@@ -2,7 +2,6 @@ import {
   AbstractMesh,
   AnimationGroup,
   ArcRotateCamera,
-  Color3,
   Engine,
   Mesh,
   Scene,
@@ -48,21 +47,30 @@ class GridPuzzle3D {
   private player!: Player;
   private spawnCell!: Position;
   private exitCell!: Position;
+  private exitGroup!: Mesh;
 
   // Collections
-  private blocked = new Set<string>();
-  private doors = new Map<string, AbstractMesh>();
-  private autoDoors = new Map<string, AbstractMesh>();
-  private boxes = new Map<string, AbstractMesh>();
-  private keys = new Map<string, AbstractMesh>();
-  private buttons = new Map<string, { mesh: AbstractMesh, direction: number, toggled: boolean }>();
-  private lava = new Map<string, { mesh: AbstractMesh, interval: number | null, isPassable: boolean }>();
+  private grid: parts.Grid;
+  private doors = new Map<number, AbstractMesh>();
+  private autoDoors = new Map<number, AbstractMesh>();
+  private boxes = new Map<number, AbstractMesh>();
+  private keys = new Map<number, AbstractMesh>();
+  private buttons = new Map<number, { mesh: AbstractMesh, direction: number, toggled: boolean }>();
+  private lava = new Map<number, parts.LavaData>();
+  private timedLava: parts.TimedLavaData[][] =
+    Array.from({ length: 10 }, () => []); // timed lava bucketed by interval (0-9)
 
   // UI elements
   private hudElement: HTMLElement;
   private bannerElement: HTMLElement;
+  private hudKeys = -1; // Key count currently shown in the HUD
 
 
+  // Frame timestamp shared by every per-frame observer
+  private now = performance.now();
+  // Running animations, stepped each frame until they return true
+  private animations: (() => boolean)[] = [];
+
   // Mesh templates
   private wallUnit!: Mesh;
 
@@ -72,6 +80,7 @@ class GridPuzzle3D {
   ) {
     this.W = this.MAP[0].length;
     this.H = this.MAP.length;
+    this.grid = parts.makeGrid(this.W, this.H);
     this.canvas = document.getElementById("c") as HTMLCanvasElement;
     this.hudElement = document.getElementById("hud") as HTMLElement;
     this.bannerElement = document.getElementById("banner") as HTMLElement;
@@ -98,19 +107,20 @@ class GridPuzzle3D {
     const cells = await parts.initMap(this.scene, { MAP: this.MAP, WALL_H: this.WALL_H, TILE: this.TILE }, {
       wallUnit: this.wallUnit,
     }, {
-      blocked: this.blocked,
+      grid: this.grid,
       boxes: this.boxes,
       doors: this.doors,
       autoDoors: this.autoDoors,
       keys: this.keys,
       lava: this.lava,
+      timedLava: this.timedLava,
       buttons: this.buttons,
     });
     Object.assign(this, cells); // Get spawn and exit cells
 
     // Create camera
     this.camera = parts.createCamera(this.scene, this.canvas);
-    this.initInput();
+    this.initAnimations();
 
     // Replace with real player asynchronously
     await this.loadPlayer();
@@ -136,6 +146,10 @@ class GridPuzzle3D {
 
   private initScene(): void {
     this.scene = parts.makeScene(this.engine);
+    // Sample the clock once per frame, before any other observer runs
+    this.scene.onBeforeRenderObservable.add(() => {
+      this.now = performance.now();
+    }, undefined, true);
   }
 
 
@@ -148,26 +162,43 @@ class GridPuzzle3D {
 
   }
 
-  private initInput(): void {
-    // Animate keys (floating and rotating)
+  private initAnimations(): void {
+    // Single per-frame observer: idle animations (keys and exit) plus running tweens
     this.scene.onBeforeRenderObservable.add(() => {
-      const t = performance.now() * 0.001;
+      const t = this.now * 0.001;
+
+      // All keys move in phase, so compute the pose once per frame
+      const rotationY = t * 2;
+      const positionY = this.TILE * 0.5 + Math.sin(t * 3) * 0.1; // Floating motion
+      const rotationX = Math.sin(t * 1.5) * 0.2;
+      const rotationZ = Math.cos(t * 1.8) * 0.15;
       for (const keyGroup of this.keys.values()) {
         // Rotate the entire key group (works for both external models and procedural keys)
-        keyGroup.rotation.y = t * 2;
-
-        // Add floating motion
-        const baseY = this.TILE * 0.5;
-        const float = Math.sin(t * 3) * 0.1;
-        keyGroup.position.y = baseY + float;
+        keyGroup.rotation.y = rotationY;
+        keyGroup.position.y = positionY;
 
         // Additional rotation around other axes for more dynamic movement
-        keyGroup.rotation.x = Math.sin(t * 1.5) * 0.2;
-        keyGroup.rotation.z = Math.cos(t * 1.8) * 0.15;
+        keyGroup.rotation.x = rotationX;
+        keyGroup.rotation.z = rotationZ;
+      }
+
+      parts.animateExit(this.exitGroup, t);
+
+      // Step running animations; finished ones are swap-popped (order doesn't matter)
+      const animations = this.animations;
+      for (let i = animations.length - 1; i >= 0; i--) {
+        if (animations[i]()) {
+          animations[i] = animations[animations.length - 1];
+          animations.pop();
+        }
       }
     });
   }
 
+  private animate(step: () => boolean): void {
+    this.animations.push(step);
+  }
+
   public async run(action: 'step' | 'toggle' | 'left' | 'right' | 'safe') {
     const actions = {
       step: "moveForward",
@@ -187,9 +218,10 @@ class GridPuzzle3D {
 
   private async safe() {
     const { nx, ny } = this.computeNextPosition()
-    const playerKey = parts.keyOf(nx, ny)
+    if (!this.inBounds(nx, ny)) return false
+    const playerKey = this.cellKey(nx, ny)
     if (this.isBlocked(nx, ny)) return false
-    if (this.lava.has(playerKey)) {
+    if (this.grid.cells[playerKey] === parts.CELL_LAVA) {
       const timedLavaData = this.lava.get(playerKey)!;
       if (!timedLavaData.isPassable) {
         return false
@@ -232,13 +264,14 @@ class GridPuzzle3D {
 
     const startTime = performance.now();
     const duration = 200; // 200ms rotation animation
+    const invDuration = 1 / duration;
 
-    const observer = this.scene.onBeforeRenderObservable.add(() => {
-      const elapsed = performance.now() - startTime;
-      const progress = Math.min(elapsed / duration, 1);
+    this.animate(() => {
+      const elapsed = this.now - startTime;
+      const progress = Math.min(elapsed * invDuration, 1);
 
       // Smooth easing
-      const easedProgress = 0.5 - 0.5 * Math.cos(Math.PI * progress);
+      const easedProgress = parts.easeInOut(progress);
 
       // Interpolate rotation
       const currentRotation = startRotation + deltaRotation * easedProgress;
@@ -250,9 +283,10 @@ class GridPuzzle3D {
         this.player.rotation = normalizedTarget;
         this.player.mesh.rotation.y = -normalizedTarget;
         this.player.moving = false;
-        this.scene.onBeforeRenderObservable.remove(observer);
         onComplete();
+        return true;
       }
+      return false;
     });
   }
 
@@ -264,17 +298,16 @@ class GridPuzzle3D {
     // Round to get grid-aligned movement
     const dx = Math.round(_dx);
     const dy = Math.round(_dy);
-    const nx = this.player.x + Math.round(dx);
-    const ny = this.player.y + Math.round(dy);
+    const nx = this.player.x + dx;
+    const ny = this.player.y + dy;
     return { dx, dy, nx, ny }
   }
 
   private async useAction(): Promise<void | string> {
     // First check if there's a button on current position
-    const currentKey = parts.keyOf(this.player.x, this.player.y);
-    if (this.buttons.has(currentKey)) {
-      const button = this.buttons.get(currentKey)!;
-
+    const currentKey = this.cellKey(this.player.x, this.player.y);
+    const button = this.buttons.get(currentKey);
+    if (button) {
       // Check if player is facing the correct direction
       const playerDirection = (-this.player.rotation + 2 * Math.PI) % (2 * Math.PI);
       const buttonDirection = (button.direction + 5 * Math.PI / 2) % (2 * Math.PI);
@@ -284,11 +317,11 @@ class GridPuzzle3D {
         Math.abs(playerDirection - buttonDirection) > (2 * Math.PI - directionThreshold);
 
       if (directionMatch && !button.toggled) {
-        // Toggle the button
-        for(const b of this.buttons.values()) {
+        // Toggle every button and start its press animation in one pass
+        for (const b of this.buttons.values()) {
           b.toggled = true;
+          this.animateButtonPress(b);
         }
-        Promise.all([...this.buttons.values()].map(b => this.animateButtonPress(b)));
         return
       } else if (button.toggled) {
         return "Button already activated.";
@@ -298,28 +331,21 @@ class GridPuzzle3D {
     }
 
     // Calculate the position directly in front of the player for door interaction
-    const dx = Math.cos(this.player.rotation);
-    const dy = Math.sin(this.player.rotation);
-    const gridDx = Math.round(dx);
-    const gridDy = Math.round(dy);
-
-    const targetX = this.player.x + gridDx;
-    const targetY = this.player.y + gridDy;
-    const targetKey = parts.keyOf(targetX, targetY);
+    const { nx: targetX, ny: targetY } = this.computeNextPosition();
+    const targetKey = this.cellKey(targetX, targetY);
 
     // Check if there's a door in front of the player
-    if (this.doors.has(targetKey)) {
+    const doorMesh = this.inBounds(targetX, targetY) ? this.doors.get(targetKey) : undefined;
+    if (doorMesh) {
       if (this.player.keys > 0) {
         this.player.keys--;
         this.updateHUD();
 
-        // Get the door mesh and open it by rotating
-        const doorMesh = this.doors.get(targetKey)!;
-
+        // Open the door by rotating it
         await this.openDoorAsync(doorMesh);
         // Wait for door opening animation to complete
         this.doors.delete(targetKey);
-        this.blocked.delete(targetKey);
+        this.grid.cells[targetKey] = parts.CELL_FLOOR;
         return "Door opened!";
 
       } else {
@@ -332,8 +358,7 @@ class GridPuzzle3D {
 
   private async openDoorAsync(doorMesh: AbstractMesh): Promise<void> {
     // Find the inner mesh (the actual door model) and rotate it
-    const doorGroup = doorMesh as Mesh;
-    const innerDoorMesh = doorGroup.getChildMeshes().find(mesh => mesh.name.endsWith('$'));
+    const innerDoorMesh = this.innerMesh(doorMesh);
 
     if (innerDoorMesh) {
       // Animate the door opening by rotating it
@@ -341,32 +366,33 @@ class GridPuzzle3D {
       const targetRotation = startRotation - Math.PI / 2;
       const startTime = performance.now();
       const duration = 500; // 500ms animation
+      const invDuration = 1 / duration;
 
       return new Promise((resolve) => {
-        const observer = this.scene.onBeforeRenderObservable.add(() => {
-          const elapsed = performance.now() - startTime;
-          const progress = Math.min(elapsed / duration, 1);
+        this.animate(() => {
+          const elapsed = this.now - startTime;
+          const progress = Math.min(elapsed * invDuration, 1);
 
           // Smooth easing
-          const easedProgress = 0.5 - 0.5 * Math.cos(Math.PI * progress);
+          const easedProgress = parts.easeInOut(progress);
 
           // Interpolate rotation
           innerDoorMesh.rotation.y = startRotation + (targetRotation - startRotation) * easedProgress;
 
           if (progress >= 1) {
             innerDoorMesh.rotation.y = targetRotation;
-            this.scene.onBeforeRenderObservable.remove(observer);
             resolve();
+            return true;
           }
+          return false;
         })
       });
     }
   }
 
   private async animateButtonPress(button: { mesh: AbstractMesh, direction: number, toggled: boolean }): Promise<void> {
-    // Find the inner mesh (the actual button model) with $ suffix
-    const buttonGroup = button.mesh as Mesh;
-    const innerButtonMesh = buttonGroup.getChildMeshes().find(mesh => mesh.name.endsWith('$'));
+    // Find the inner mesh (the actual button model)
+    const innerButtonMesh = this.innerMesh(button.mesh);
 
     if (innerButtonMesh) {
       // Animate the button pressing down by moving it in Z axis
@@ -374,23 +400,25 @@ class GridPuzzle3D {
       const targetX = Math.PI / 3;
       const startTime = performance.now();
       const duration = 200; // 200ms animation
+      const invDuration = 1 / duration;
 
       // Press button down
       await new Promise<void>((resolve) => {
-        const observer = this.scene.onBeforeRenderObservable.add(() => {
-          const elapsed = performance.now() - startTime;
-          const progress = Math.min(elapsed / duration, 1);
+        this.animate(() => {
+          const elapsed = this.now - startTime;
+          const progress = Math.min(elapsed * invDuration, 1);
 
           // Smooth easing
-          const easedProgress = 0.5 - 0.5 * Math.cos(Math.PI * progress);
+          const easedProgress = parts.easeInOut(progress);
 
           // Interpolate X rotation
           innerButtonMesh.rotation.x = startX + (targetX - startX) * easedProgress;
 
           if (progress >= 1) {
-            this.scene.onBeforeRenderObservable.remove(observer);
             resolve();
+            return true;
           }
+          return false;
         })
       });
 
@@ -420,8 +448,8 @@ class GridPuzzle3D {
     const openPromises: Promise<void>[] = [];
 
     for (const [key, doorMesh] of this.autoDoors.entries()) {
-      // Remove from blocked set to allow passage
-      this.blocked.delete(key);
+      // Clear the cell to allow passage
+      this.grid.cells[key] = parts.CELL_FLOOR;
 
       // Animate door opening
       openPromises.push(this.openDoorAsync(doorMesh));
@@ -441,14 +469,14 @@ class GridPuzzle3D {
     const closePromises: Promise<void>[] = [];
 
     for (const [key, doorMesh] of this.autoDoors.entries()) {
-      // Add back to blocked set
-      this.blocked.add(key);
+      // Block the cell again
+      this.grid.cells[key] = parts.CELL_DOOR;
 
       // Animate door closing
       closePromises.push(this.closeDoorAsync(doorMesh));
     }
-    const playerKey = parts.keyOf(this.player.x, this.player.y);
-    if (this.blocked.has(playerKey)) {
+    const playerKey = this.cellKey(this.player.x, this.player.y);
+    if (this.grid.cells[playerKey] === parts.CELL_DOOR) {
       this.bye("You got crushed by the door.");
     }
 
@@ -457,8 +485,7 @@ class GridPuzzle3D {
 
   private async closeDoorAsync(doorMesh: AbstractMesh): Promise<void> {
     // Find the inner mesh (the actual door model) and rotate it back
-    const doorGroup = doorMesh as Mesh;
-    const innerDoorMesh = doorGroup.getChildMeshes().find(mesh => mesh.name.endsWith('$'));
+    const innerDoorMesh = this.innerMesh(doorMesh);
 
     if (innerDoorMesh) {
       // Animate the door closing by rotating it back
@@ -466,22 +493,24 @@ class GridPuzzle3D {
       const targetRotation = startRotation + Math.PI / 2; // Rotate back to closed position
       const startTime = performance.now();
       const duration = 500; // 500ms animation
+      const invDuration = 1 / duration;
 
       return new Promise((resolve) => {
-        const observer = this.scene.onBeforeRenderObservable.add(() => {
-          const elapsed = performance.now() - startTime;
-          const progress = Math.min(elapsed / duration, 1);
+        this.animate(() => {
+          const elapsed = this.now - startTime;
+          const progress = Math.min(elapsed * invDuration, 1);
 
           // Smooth easing
-          const easedProgress = 0.5 - 0.5 * Math.cos(Math.PI * progress);
+          const easedProgress = parts.easeInOut(progress);
 
           // Interpolate rotation
           innerDoorMesh.rotation.y = startRotation + (targetRotation - startRotation) * easedProgress;
 
           if (progress >= 1) {
-            this.scene.onBeforeRenderObservable.remove(observer);
             resolve();
+            return true;
           }
+          return false;
         })
       });
     }
@@ -493,22 +522,24 @@ class GridPuzzle3D {
     const targetX = originalZ;
     const startTime = performance.now();
     const duration = 200; // 200ms animation
+    const invDuration = 1 / duration;
 
     return new Promise((resolve) => {
-      const observer = this.scene.onBeforeRenderObservable.add(() => {
-        const elapsed = performance.now() - startTime;
-        const progress = Math.min(elapsed / duration, 1);
+      this.animate(() => {
+        const elapsed = this.now - startTime;
+        const progress = Math.min(elapsed * invDuration, 1);
 
         // Smooth easing
-        const easedProgress = 0.5 - 0.5 * Math.cos(Math.PI * progress);
+        const easedProgress = parts.easeInOut(progress);
 
         // Interpolate X rotation back to original
         innerButtonMesh.rotation.x = startX + (targetX - startX) * easedProgress;
 
         if (progress >= 1) {
-          this.scene.onBeforeRenderObservable.remove(observer);
           resolve();
+          return true;
         }
+        return false;
       })
     });
   }
@@ -526,22 +557,24 @@ class GridPuzzle3D {
   }
 
   private updateTimedLavaPassability(currentInterval: number): void {
-    for (const lavaData of this.lava.values()) {
-      if (lavaData.interval === null) continue; // Skip non-timed lava
+    // Only the buckets next to the current interval can change
+    const from = Math.max(currentInterval - 1, 0);
+    const to = Math.min(currentInterval + 1, this.timedLava.length - 1);
+    for (let interval = from; interval <= to; interval++) {
       // Lava block becomes passable during its interval and the next one
-      if (Math.abs(lavaData.interval - currentInterval) <= 1) {
-        lavaData.isPassable = (lavaData.interval >= currentInterval);
+      const isPassable = interval >= currentInterval;
+      for (const lavaData of this.timedLava[interval]) {
+        lavaData.isPassable = isPassable;
 
         // Simply hide/show the lava mesh
-        lavaData.mesh.setEnabled(!lavaData.isPassable); // Hide when passable, show when not passable
-
+        lavaData.mesh.setEnabled(!isPassable); // Hide when passable, show when not passable
       }
     }
     this.checkLava()
   }
 
   private checkLava() {
-    const playerKey = parts.keyOf(this.player.x, this.player.y);
+    const playerKey = this.cellKey(this.player.x, this.player.y);
     const lavaData = this.lava.get(playerKey)
     if (!lavaData) return
     if (!lavaData.isPassable) {
@@ -552,13 +585,14 @@ class GridPuzzle3D {
 
   private resetTimedLava(): void {
     // Reset all timed lava to non-passable (deadly) state
-    for (const lavaData of this.lava.values()) {
-      if (lavaData.interval === null) continue; // Skip non-timed lava
-      lavaData.isPassable = false;
-      // Show all lava meshes again
-      lavaData.mesh.setEnabled(true);
+    for (const bucket of this.timedLava) {
+      for (const lavaData of bucket) {
+        lavaData.isPassable = false;
+        // Show all lava meshes again
+        lavaData.mesh.setEnabled(true);
 
-      // No blocking needed - lava kills, doesn't block
+        // No blocking needed - lava kills, doesn't block
+      }
     }
     this.checkLava()
   }
@@ -570,7 +604,7 @@ class GridPuzzle3D {
       return "You can't go there";
     }
 
-    const targetKey = parts.keyOf(nx, ny);
+    const targetKey = this.cellKey(nx, ny);
 
     // Doors now block movement - they must be opened with T key first
     if (this.doors.has(targetKey)) {
@@ -578,23 +612,29 @@ class GridPuzzle3D {
     }
 
     // Handle box pushing
-    if (this.boxes.has(targetKey)) {
+    const box = this.boxes.get(targetKey);
+    if (box) {
       const bx = nx + dx;
       const by = ny + dy;
-      const boxTargetKey = parts.keyOf(bx, by);
+      const boxTargetKey = this.cellKey(bx, by);
 
       if (!this.inBounds(bx, by) || this.isBlocked(bx, by)) {
         return "Can't push box";
       }
 
-      const box = this.boxes.get(targetKey)!;
       this.boxes.delete(targetKey);
-      this.blocked.delete(targetKey);
+      this.grid.cells[targetKey] = parts.CELL_FLOOR;
 
-      if (this.lava.has(boxTargetKey)) {
+      const lava = this.lava.get(boxTargetKey);
+      if (lava) {
         // Box is being pushed into lava - animate it falling and then remove both
-        const lava = this.lava.get(boxTargetKey)!
         this.lava.delete(boxTargetKey);
+        this.grid.cells[boxTargetKey] = parts.CELL_FLOOR;
+        if (lava.interval !== null) {
+          const bucket = this.timedLava[lava.interval];
+          bucket[bucket.indexOf(lava as parts.TimedLavaData)] = bucket[bucket.length - 1];
+          bucket.pop();
+        }
         this.tweenPosition(
           box,
           this.cellToWorld(bx, by, this.TILE * 0.49), // Move to lava position first
@@ -615,7 +655,7 @@ class GridPuzzle3D {
       } else {
         // Normal box push to empty space
         this.boxes.set(boxTargetKey, box);
-        this.blocked.add(boxTargetKey);
+        this.grid.cells[boxTargetKey] = parts.CELL_BOX;
         this.tweenPosition(
           box,
           this.cellToWorld(bx, by, this.TILE * 0.49),
@@ -638,7 +678,7 @@ class GridPuzzle3D {
 
     // Store initial positions for camera following
     const initialCameraPosition = this.camera.position.clone();
-    const initialCameraTarget = this.camera.getTarget();
+    const initialCameraTarget = this.camera.getTarget().clone(); // The camera may keep a reference to its target
     const initialPlayerPosition = this.player.mesh.position.clone();
     const targetPlayerPosition = this.cellToWorld(nx, ny, this.TILE * 0.5);
     const movementDelta = targetPlayerPosition.subtract(initialPlayerPosition);
@@ -665,45 +705,53 @@ class GridPuzzle3D {
   ): Promise<void> {
     const startPos = this.player.mesh.position.clone();
     const startTime = performance.now();
+    const invDuration = 1 / durationMs;
+    // Scratch vectors reused every frame of this tween
+    const cameraOffset = new Vector3();
+    const cameraPosition = new Vector3();
+    const cameraTarget = new Vector3();
 
     return new Promise((resolve) => {
-      const observer = this.scene.onBeforeRenderObservable.add(() => {
-        const elapsed = performance.now() - startTime;
-        const progress = Math.min(elapsed / durationMs, 1);
+      this.animate(() => {
+        const elapsed = this.now - startTime;
+        const progress = Math.min(elapsed * invDuration, 1);
 
         // Smooth easing
-        const easedProgress = 0.5 - 0.5 * Math.cos(Math.PI * progress);
+        const easedProgress = parts.easeInOut(progress);
 
         // Update player position
-        this.player.mesh.position = Vector3.Lerp(startPos, targetPos, easedProgress);
+        Vector3.LerpToRef(startPos, targetPos, easedProgress, this.player.mesh.position);
 
-        // Update camera position and target to follow
-        const cameraOffset = movementDelta.scale(easedProgress);
-        this.camera.position = initialCameraPosition.add(cameraOffset);
-        this.camera.setTarget(initialCameraTarget.add(cameraOffset));
+        // Update camera target then position to follow (setting the position rebuilds the orbit)
+        movementDelta.scaleToRef(easedProgress, cameraOffset);
+        initialCameraTarget.addToRef(cameraOffset, cameraTarget);
+        this.camera.setTarget(cameraTarget);
+        initialCameraPosition.addToRef(cameraOffset, cameraPosition);
+        this.camera.position = cameraPosition;
 
         if (progress >= 1) {
-          this.scene.onBeforeRenderObservable.remove(observer);
           resolve();
+          return true;
         }
+        return false;
       })
     });
   }
 
   private async handlePlayerLanded(): Promise<string | void> {
-    const playerKey = parts.keyOf(this.player.x, this.player.y);
+    const playerKey = this.cellKey(this.player.x, this.player.y);
 
     // Key pickup
-    if (this.keys.has(playerKey)) {
-      // Get the key color before disposing
-      this.keys.get(playerKey)!.dispose();
+    const key = this.keys.get(playerKey);
+    if (key) {
+      key.dispose();
       this.keys.delete(playerKey);
       this.player.keys++;
       this.updateHUD();
     }
 
     // Timed lava check - only deadly when visible (not disabled)
-    if (this.lava.has(playerKey)) {
+    if (this.grid.cells[playerKey] === parts.CELL_LAVA) {
       const timedLavaData = this.lava.get(playerKey)!;
       if (!timedLavaData.isPassable) { // If lava is visible, it's deadly
         this.player.mesh.dispose();
@@ -720,14 +768,8 @@ class GridPuzzle3D {
   private async triggerWinAnimation(): Promise<string> {
     this.player.moving = true; // Prevent further movement during animation
     this.player.won = new Date
-    // Find the exit group to enhance its glow
-    const exitKey = parts.keyOf(this.exitCell.x, this.exitCell.y);
-    const exitGroup = this.scene.getMeshByName(`exitGroup_${this.exitCell.x}_${this.exitCell.y}`);
-
     // Enhance exit glow animation
-    if (exitGroup) {
-      this.enhanceExitGlow(exitGroup);
-    }
+    this.enhanceExitGlow(this.exitGroup);
 
     // Animate player rotating upward
     this.animatePlayerWin();
@@ -739,7 +781,7 @@ class GridPuzzle3D {
   }
 
   private enhanceExitGlow(exitGroup: AbstractMesh): void {
-    const orbMesh = exitGroup.getChildMeshes().find(mesh => mesh.name.includes('exitOrb'));
+    const orbMesh = exitGroup.metadata?.exitOrb as AbstractMesh | undefined;
 
     if (orbMesh && orbMesh.material) {
       const orbMaterial = orbMesh.material as StandardMaterial;
@@ -747,11 +789,11 @@ class GridPuzzle3D {
 
       // Create intense glow animation
       const startTime = performance.now();
-      const glowObserver = this.scene.onBeforeRenderObservable.add(() => {
-        const elapsed = (performance.now() - startTime) * 0.001;
+      this.animate(() => {
+        const elapsed = (this.now - startTime) * 0.001;
         const intensity = 2 + Math.sin(elapsed * 8) * 0.5; // Fast pulsing
 
-        orbMaterial.emissiveColor = new Color3(
+        orbMaterial.emissiveColor.copyFromFloats(
           originalEmissive.r * intensity,
           originalEmissive.g * intensity,
           originalEmissive.b * intensity
@@ -759,9 +801,10 @@ class GridPuzzle3D {
 
         // Stop after 3 seconds
         if (elapsed > 3) {
-          this.scene.onBeforeRenderObservable.remove(glowObserver);
           orbMaterial.emissiveColor = originalEmissive;
+          return true;
         }
+        return false;
       });
     }
   }
@@ -769,6 +812,7 @@ class GridPuzzle3D {
   private animatePlayerWin(): void {
     const startTime = performance.now();
     const duration = 1000; // 2 seconds
+    const invDuration = 1 / duration;
     const startRotation = this.player.mesh.rotation.clone();
 
     // Target rotation: rotate upward (around X axis)
@@ -782,25 +826,26 @@ class GridPuzzle3D {
     const startPosition = this.player.mesh.position.clone();
     const targetPosition = startPosition.add(new Vector3(0, 1.5, 0));
 
-    const winObserver = this.scene.onBeforeRenderObservable.add(() => {
-      const elapsed = performance.now() - startTime;
-      const progress = Math.min(elapsed / duration, 1);
+    this.animate(() => {
+      const elapsed = this.now - startTime;
+      const progress = Math.min(elapsed * invDuration, 1);
 
       // Smooth easing for the rotation
-      const easedProgress = 0.5 - 0.5 * Math.cos(Math.PI * progress);
+      const easedProgress = parts.easeInOut(progress);
 
       // Interpolate rotation
-      this.player.mesh.rotation = Vector3.Lerp(startRotation, targetRotation, easedProgress);
+      Vector3.LerpToRef(startRotation, targetRotation, easedProgress, this.player.mesh.rotation);
 
       // Interpolate position (slight upward movement)
-      this.player.mesh.position = Vector3.Lerp(startPosition, targetPosition, easedProgress);
+      Vector3.LerpToRef(startPosition, targetPosition, easedProgress, this.player.mesh.position);
 
       // Add a gentle spinning effect around Y axis for extra flair
       this.player.mesh.rotation.y = startRotation.y + easedProgress * Math.PI * 2;
 
       if (progress >= 1) {
-        this.scene.onBeforeRenderObservable.remove(winObserver);
+        return true;
       }
+      return false;
     });
   }
 
@@ -835,21 +880,24 @@ class GridPuzzle3D {
   ): void {
     const startPos = mesh.position.clone();
     const startTime = performance.now();
+    const invDuration = 1 / durationMs;
+    // Constant for the whole tween; squared length avoids a sqrt
+    const moveDirection = targetPos.subtract(startPos);
+    const hasDirection = moveDirection.lengthSquared() > 0.001 * 0.001;
 
-    const observer = this.scene.onBeforeRenderObservable.add(() => {
-      const elapsed = performance.now() - startTime;
-      const progress = Math.min(elapsed / durationMs, 1);
+    this.animate(() => {
+      const elapsed = this.now - startTime;
+      const progress = Math.min(elapsed * invDuration, 1);
 
       // Smooth easing
-      const easedProgress = 0.5 - 0.5 * Math.cos(Math.PI * progress);
+      const easedProgress = parts.easeInOut(progress);
 
-      mesh.position = Vector3.Lerp(startPos, targetPos, easedProgress);
+      Vector3.LerpToRef(startPos, targetPos, easedProgress, mesh.position);
 
       // Special handling for player movement
       if (mesh === this.player.mesh) {
         // Face the movement direction
-        const moveDirection = targetPos.subtract(startPos);
-        if (moveDirection.length() > 0.001) {
+        if (hasDirection) {
           const targetRotationY = Math.atan2(moveDirection.x, moveDirection.z);
           mesh.rotation.z = targetRotationY + Math.PI / 2; // Adjust for model orientation
         }
@@ -868,11 +916,10 @@ class GridPuzzle3D {
       }
 
       if (progress >= 1) {
-        if (observer) {
-          this.scene.onBeforeRenderObservable.remove(observer);
-        }
         onComplete?.();
+        return true;
       }
+      return false;
     });
   }
 
@@ -886,15 +933,24 @@ class GridPuzzle3D {
   }
 
   private isBlocked(i: number, j: number): boolean {
-    return this.blocked.has(parts.keyOf(i, j));
+    return this.inBounds(i, j) && this.grid.cells[this.cellKey(i, j)] >= parts.CELL_WALL;
+  }
+
+  // Animated child stored on door and button groups at creation time
+  private innerMesh(group: AbstractMesh): AbstractMesh | undefined {
+    return group.metadata?.inner;
+  }
+
+  private cellKey(i: number, j: number): number {
+    return parts.cellIndex(this.grid, i, j);
   }
 
   private updateHUD(): void {
+    // Only rebuild the HUD when the key count actually changed
+    if (this.player.keys === this.hudKeys) return;
     const keysContainer = document.getElementById("keys-container");
     if (!keysContainer) return;
-
-    // Clear existing keys
-    keysContainer.innerHTML = "";
+    this.hudKeys = this.player.keys;
 
     // If no keys, show empty state
     if (this.player.keys === 0) {
@@ -0,0 +1,3 @@
+// Cosine ease-in-out shared by every tween; the final frame lands exactly on 1
+export const easeInOut = (progress: number): number =>
+  progress >= 1 ? 1 : 0.5 - 0.5 * Math.cos(Math.PI * progress);
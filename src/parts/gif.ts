@@ -22,22 +22,17 @@ export async function initGifAnimation(scene: Scene, material: StandardMaterial,
 
   // Create a single dynamic texture that we'll reuse
   const firstResult = await imageDecoder.decode({ frameIndex: 0 });
-  const canvas = document.createElement('canvas');
-  canvas.width = firstResult.image.displayWidth;
-  canvas.height = firstResult.image.displayHeight;
-  const ctx = canvas.getContext('2d');
+  const width = firstResult.image.displayWidth;
+  const height = firstResult.image.displayHeight;
+  firstResult.image.close();
   let timeout: NodeJS.Timeout;
 
-  if (!ctx) {
-    console.error('Could not get canvas context');
-    throw new Error('Could not get canvas context');
-  }
-
-  // Create the dynamic texture once
-  const dynamicTexture = new DynamicTexture(`lavaAnimated`, { width: canvas.width, height: canvas.height }, scene, false);
+  // Create the dynamic texture once; frames are drawn straight into its canvas
+  const dynamicTexture = new DynamicTexture(`lavaAnimated`, { width, height }, scene, false);
   const dynamicCtx = dynamicTexture.getContext();
 
-  // Set up the material with the dynamic texture
+  // Set up the material with the dynamic texture, dropping the static fallback
+  material.diffuseTexture?.dispose();
   material.diffuseTexture = dynamicTexture;
   material.emissiveTexture = dynamicTexture;
 
@@ -46,13 +41,9 @@ export async function initGifAnimation(scene: Scene, material: StandardMaterial,
     try {
       const result = await imageDecoder.decode({ frameIndex: imageIndex });
 
-      // Draw frame to our canvas
-      ctx.clearRect(0, 0, canvas.width, canvas.height);
-      ctx.drawImage(result.image, 0, 0);
-
-      // Copy canvas to dynamic texture
-      dynamicCtx.clearRect(0, 0, canvas.width, canvas.height);
-      dynamicCtx.drawImage(canvas, 0, 0);
+      // Draw frame to the dynamic texture
+      dynamicCtx.clearRect(0, 0, width, height);
+      dynamicCtx.drawImage(result.image, 0, 0);
       dynamicTexture.update();
 
       imageIndex++;
@@ -62,6 +53,7 @@ export async function initGifAnimation(scene: Scene, material: StandardMaterial,
 
       // Use the frame duration from the GIF, with a minimum of 100ms
       const duration = Math.max(result.image.duration / 1000.0, 100);
+      result.image.close(); // Release the decoded frame right away
       timeout = setTimeout(render, duration / 5);
     } catch (error) {
       console.error('Error decoding GIF frame:', error);
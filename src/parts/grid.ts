@@ -0,0 +1,19 @@
+import { AbstractMesh } from "@babylonjs/core";
+
+// Cell types stored in the flat grid; anything from CELL_WALL up blocks movement
+export const CELL_FLOOR = 0;
+export const CELL_LAVA = 1;
+export const CELL_WALL = 2;
+export const CELL_BOX = 3;
+export const CELL_DOOR = 4;
+
+export type Grid = { W: number, H: number, cells: Uint8Array };
+
+// Lava cell state; interval is the 0-9 timed slot, or null for permanent lava
+export type LavaData = { mesh: AbstractMesh, interval: number | null, isPassable: boolean };
+// Only timed lava goes into the per-interval buckets
+export type TimedLavaData = LavaData & { interval: number };
+
+export const makeGrid = (W: number, H: number): Grid => ({ W, H, cells: new Uint8Array(W * H) });
+
+export const cellIndex = (grid: { W: number }, i: number, j: number) => j * grid.W + i;
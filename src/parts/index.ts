@@ -2,4 +2,5 @@ export * from './engine'
 export * from './scene'
 export * from './units'
 export * from './map'
-export * from './keyOf'
\ No newline at end of file
+export * from './grid'
+export * from './ease'
\ No newline at end of file
@@ -1 +0,0 @@
-export const keyOf = (i: number, j: number) => `${i},${j}`
\ No newline at end of file
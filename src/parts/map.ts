@@ -1,24 +1,26 @@
 import { AbstractMesh, Mesh, Scene } from "@babylonjs/core";
 import { cellToWorld } from "./cellToWorld";
-import { createAutoDoor, createBox, createDoor, createKey, createLava, createWall, createButton } from "./units";
-import { createExit } from "./units/exit";
+import { Grid, LavaData, TimedLavaData } from "./grid";
+import { createAutoDoor, createBox, createDoor, createExit, createKey, createLava, createWall, createButton, finalizeWalls } from "./units";
 
 export const initMap = async (scene: Scene, config: { MAP: string[], WALL_H: number, TILE: number },
-  units: { wallUnit: Mesh },
+  units: { wallUnit: Mesh, lavaUnit?: Mesh },
   state: {
-    blocked: Set<string>,
-    boxes: Map<string, AbstractMesh>,
-    doors: Map<string, AbstractMesh>,
-    autoDoors: Map<string, AbstractMesh>,
-    keys: Map<string, AbstractMesh>,
-    buttons: Map<string, { mesh: AbstractMesh, direction: number, toggled: boolean }>,
-    lava: Map<string, { mesh: AbstractMesh, interval: number | null, isPassable: boolean }>
+    grid: Grid,
+    boxes: Map<number, AbstractMesh>,
+    doors: Map<number, AbstractMesh>,
+    autoDoors: Map<number, AbstractMesh>,
+    keys: Map<number, AbstractMesh>,
+    buttons: Map<number, { mesh: AbstractMesh, direction: number, toggled: boolean }>,
+    lava: Map<number, LavaData>,
+    timedLava: TimedLavaData[][]
   }) => {
   const W = config.MAP[0].length;
   const H = config.MAP.length;
 
   let exitCell: { x: number; y: number } | false = false;
   let spawnCell: { x: number; y: number } | false = false;
+  let exitGroup: Mesh | null = null;
 
   const promises: Promise<void>[] = [];
 
@@ -62,7 +64,7 @@ export const initMap = async (scene: Scene, config: { MAP: string[], WALL_H: num
           promises.push(createButton(scene, config, i, j, p, state, 'y'));
           break;
         case "~":
-          createLava(scene, config, i, j, p, state,  null);
+          createLava(scene, config, i, j, p, units, state, null);
           break;
         case "0":
         case "1":
@@ -74,10 +76,10 @@ export const initMap = async (scene: Scene, config: { MAP: string[], WALL_H: num
         case "7":
         case "8":
         case "9":
-          createLava(scene, config, i, j, p, state, parseInt(ch));
+          createLava(scene, config, i, j, p, units, state, parseInt(ch));
           break;
         case "E":
-          createExit(scene, config, i, j, p);
+          exitGroup = createExit(scene, config, i, j, p);
           exitCell = { x: i, y: j };
           break;
         case "S":
@@ -87,11 +89,14 @@ export const initMap = async (scene: Scene, config: { MAP: string[], WALL_H: num
     }
   }
 
+  // Upload all wall transforms in one go
+  finalizeWalls(units);
+
   // Wait for all keys and doors to load
   await Promise.all(promises);
 
-  if (!spawnCell || !exitCell) {
+  if (!spawnCell || !exitCell || !exitGroup) {
     throw new Error("Map must include S (spawn) and E (exit).");
   }
-  return { spawnCell, exitCell };
+  return { spawnCell, exitCell, exitGroup };
 }
\ No newline at end of file
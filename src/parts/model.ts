@@ -0,0 +1,22 @@
+import { AbstractMesh, AssetContainer, LoadAssetContainerAsync, Scene } from "@babylonjs/core";
+
+// Each GLB is loaded once per scene; every entity clones it from the container
+const containers = new WeakMap<Scene, Map<string, Promise<AssetContainer>>>();
+
+export const instantiateModel = async (scene: Scene, url: string): Promise<AbstractMesh> => {
+  let cache = containers.get(scene);
+  if (!cache) {
+    cache = new Map();
+    containers.set(scene, cache);
+  }
+
+  let container = cache.get(url);
+  if (!container) {
+    container = LoadAssetContainerAsync(url, scene);
+    cache.set(url, container);
+  }
+
+  // Clones share geometry and materials with the container, keep original names ("__root__")
+  const entries = (await container).instantiateModelsToScene(name => name, false, { doNotInstantiate: true });
+  return entries.rootNodes[0] as AbstractMesh;
+}
@@ -1,20 +1,17 @@
-import { AbstractMesh, Color3, ImportMeshAsync, InstancedMesh, Mesh, MeshBuilder, Scene, StandardMaterial, Vector3 } from "@babylonjs/core";
-import { keyOf } from "../keyOf";
+import { AbstractMesh, Color3, InstancedMesh, Mesh, MeshBuilder, Scene, StandardMaterial, Vector3 } from "@babylonjs/core";
+import { instantiateModel } from "../model";
+import { CELL_BOX, Grid, cellIndex } from "../grid";
 
 
 export const makeBox = async (scene: Scene, config: { TILE: number }) => {
   // Import the minecraft box GLB model
-  const result = await ImportMeshAsync("assets/models/minecraft_box.glb", scene);
+  const root = await instantiateModel(scene, "assets/models/minecraft_box.glb");
 
   // Create a parent mesh for the imported model
   const boxGroup = new Mesh(`minecraftBox_`, scene);
 
-  // Parent all imported meshes to our box group
-  result.meshes.forEach((mesh) => {
-    if (mesh.name === "__root__") {
-      mesh.parent = boxGroup;
-    }
-  });
+  // Parent the imported model to our box group
+  root.parent = boxGroup;
   const h = .43
   boxGroup.scaling = new Vector3(h, h, h);
   boxGroup.rotation.y = .24;
@@ -29,14 +26,15 @@ export const makeBox = async (scene: Scene, config: { TILE: number }) => {
 export const createBox = async (
   scene: Scene, config: { TILE: number }, i: number, j: number, p: Vector3,
   state: {
-    blocked: Set<string>,
-    boxes: Map<string, AbstractMesh>
+    grid: Grid,
+    boxes: Map<number, AbstractMesh>
   }
 ): Promise<void> => {
   const boxGroup = await makeBox(scene, config);
 
   // Clone the minecraft box template instead of creating instance
   boxGroup.position = p.add(new Vector3(0, config.TILE * 0.5, 0));
-  state.boxes.set(keyOf(i, j), boxGroup);
-  state.blocked.add(keyOf(i, j));
+  const index = cellIndex(state.grid, i, j);
+  state.boxes.set(index, boxGroup);
+  state.grid.cells[index] = CELL_BOX;
 }
\ No newline at end of file
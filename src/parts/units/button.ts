@@ -1,27 +1,25 @@
-import { AbstractMesh, ImportMeshAsync, Mesh, Scene, Vector3 } from "@babylonjs/core";
-import { keyOf } from "../keyOf";
+import { AbstractMesh, Mesh, Scene, Vector3 } from "@babylonjs/core";
+import { instantiateModel } from "../model";
+import { Grid, cellIndex } from "../grid";
 
 const makeButton = async (scene: Scene, config: { TILE: number }) => {
-    const result = await ImportMeshAsync("assets/models/btn.glb", scene);
+    const root = await instantiateModel(scene, "assets/models/btn.glb");
 
     // Create a parent mesh for the imported button model
     const buttonGroup_ = new Mesh(`button$`, scene);
 
-    // Parent all imported meshes to our button group
-    result.meshes.forEach(mesh => {
-        if (mesh.name === "__root__") {
-            mesh.parent = buttonGroup_;
-            // Scale the button to fit the tile size
-            const scale = 3; 
-            mesh.scaling = new Vector3(scale, scale, scale);
-            mesh.position = new Vector3(0, -.75, 1.3); // Center the button
-        }
-    });
+    // Parent the imported model to our button group
+    root.parent = buttonGroup_;
+    // Scale the button to fit the tile size
+    const scale = 3; 
+    root.scaling = new Vector3(scale, scale, scale);
+    root.position = new Vector3(0, -.75, 1.3); // Center the button
 
     buttonGroup_.position = new Vector3(0, 1, -1.2); // Center the button
     buttonGroup_.rotation.x = -1 * Math.PI / 3;
     const buttonGroup = new Mesh(`button`, scene);
     buttonGroup_.parent = buttonGroup;
+    buttonGroup.metadata = { inner: buttonGroup_ }; // Animated part, looked up by animateButtonPress
     return buttonGroup;
 }
 
@@ -31,7 +29,7 @@ export const createButton = async function (
     i: number,
     j: number,
     p: Vector3,
-    state: { buttons: Map<string, { mesh: AbstractMesh, direction: number, toggled: boolean }> },
+    state: { grid: Grid, buttons: Map<number, { mesh: AbstractMesh, direction: number, toggled: boolean }> },
     buttonType: string // 'A', 'a', 'B', 'b'
 ): Promise<void> {
     const buttonGroup = await makeButton(scene, { TILE: config.TILE });
@@ -58,7 +56,7 @@ export const createButton = async function (
             break;
     }
 
-    state.buttons.set(keyOf(i, j), {
+    state.buttons.set(cellIndex(state.grid, i, j), {
         mesh: buttonGroup,
         direction: direction,
         toggled: false
@@ -1,38 +1,36 @@
-import { AbstractMesh, Color3, ImportMeshAsync, Mesh, PointLight, Scene, Vector3 } from "@babylonjs/core";
-import { keyOf } from "../keyOf";
+import { AbstractMesh, Mesh, Scene, Vector3 } from "@babylonjs/core";
+import { instantiateModel } from "../model";
+import { CELL_DOOR, Grid, cellIndex } from "../grid";
 
 
 const makeDoor = async (scene: Scene, config: { TILE: number, WALL_H: number }) => {
-  const result = await ImportMeshAsync("assets/models/snake_doors.glb", scene);
+  const root = await instantiateModel(scene, "assets/models/snake_doors.glb");
 
   // Create a parent mesh for the imported stone door model
   const doorGroup_ = new Mesh(`stoneDoor$`, scene);
   doorGroup_.position = new Vector3(config.TILE * 0.25, config.TILE * 0.5, config.TILE * 0.25);
   doorGroup_.rotation.y = 0; // -Math.PI / 2 If open
-  // Parent all imported meshes to our door group
+  // Parent the imported model to our door group
   const doorGroupDeep = new Mesh(`stoneDoorDeep`, scene);
   doorGroupDeep.parent = doorGroup_;
   doorGroupDeep.rotation.x = 0 * -Math.PI / 2; // Lay flat on ground
   doorGroupDeep.position = new Vector3(-config.TILE * .75, config.TILE * 0.5, -config.TILE * .8);
-  result.meshes.forEach(mesh => {
-    if (mesh.name === "__root__") {
-      mesh.parent = doorGroupDeep;
-      // Scale the door to fit the tile size
-      const h = 0.07
-      mesh.scaling = new Vector3(h, h, h); // Adjust scaling as needed
-      mesh.position = new Vector3(.9 - config.TILE * 0.25, -1.5, 1 - config.TILE * 0.25); // Adjust scaling as needed
-    }
-  });
+  root.parent = doorGroupDeep;
+  // Scale the door to fit the tile size
+  const h = 0.07
+  root.scaling = new Vector3(h, h, h); // Adjust scaling as needed
+  root.position = new Vector3(.9 - config.TILE * 0.25, -1.5, 1 - config.TILE * 0.25); // Adjust scaling as needed
 
   const doorGroup = new Mesh(`stoneDoor`, scene);
   doorGroup_.parent = doorGroup;
+  doorGroup.metadata = { inner: doorGroup_ }; // Animated part, looked up by openDoorAsync & co.
   return doorGroup;
 }
 
 export const createAutoDoor = async function (
   scene: Scene,
   config: { TILE: number, WALL_H: number }, i: number, j: number, p: Vector3,
-  state: { blocked: Set<string>, autoDoors: Map<string, AbstractMesh> },
+  state: { grid: Grid, autoDoors: Map<number, AbstractMesh> },
   rotated: boolean = false
 ): Promise<void> {
   const doorGroup = await makeDoor(scene, { TILE: config.TILE, WALL_H: config.WALL_H });
@@ -43,6 +41,7 @@ export const createAutoDoor = async function (
     doorGroup.rotation.y = Math.PI / 2; // Rotate 90 degrees
   }
   
-  state.autoDoors.set(keyOf(i, j), doorGroup);
-  state.blocked.add(keyOf(i, j));
+  const index = cellIndex(state.grid, i, j);
+  state.autoDoors.set(index, doorGroup);
+  state.grid.cells[index] = CELL_DOOR;
 }
\ No newline at end of file
@@ -67,32 +67,37 @@ export const makeExit = (scene: Scene, config: { TILE: number }) => {
   ring1.material = ringMaterial;
   ring2.material = ringMaterial;
 
-  // Animation
-  scene.onBeforeRenderObservable.add(() => {
-    const time = performance.now() * 0.001;
-
-    // Rotate rings in opposite directions
-    ring1.rotation.y = time * 0.8;
-    ring2.rotation.y = -time * 1.2;
-    ring1.rotation.x = Math.sin(time * 0.5) * 0.2;
-    ring2.rotation.x = Math.cos(time * 0.7) * 0.15;
-
-    // Bob the orb up and down
-    exitOrb.position.y = 0.25 + Math.sin(time * 2) * 0.05;
-
-    // Pulsing glow effect
-    const glowIntensity = 0.8 + 0.4 * Math.sin(time * 3);
-    orbMaterial.emissiveColor = new Color3(
-      0.6 * glowIntensity,
-      1.0 * glowIntensity,
-      0.7 * glowIntensity
-    );
-  });
+  // Parts driven by animateExit from the game's per-frame update
+  exitGroup.metadata = { ring1, ring2, exitOrb, orbMaterial };
 
   return exitGroup;
 }
 
-export const createExit = (scene: Scene, config: { TILE: number }, i: number, j: number, p: Vector3): void => {
+export const animateExit = (exitGroup: Mesh, time: number): void => {
+  const { ring1, ring2, exitOrb, orbMaterial } = exitGroup.metadata as {
+    ring1: Mesh, ring2: Mesh, exitOrb: Mesh, orbMaterial: StandardMaterial
+  };
+
+  // Rotate rings in opposite directions
+  ring1.rotation.y = time * 0.8;
+  ring2.rotation.y = -time * 1.2;
+  ring1.rotation.x = Math.sin(time * 0.5) * 0.2;
+  ring2.rotation.x = Math.cos(time * 0.7) * 0.15;
+
+  // Bob the orb up and down
+  exitOrb.position.y = 0.25 + Math.sin(time * 2) * 0.05;
+
+  // Pulsing glow effect
+  const glowIntensity = 0.8 + 0.4 * Math.sin(time * 3);
+  orbMaterial.emissiveColor.copyFromFloats(
+    0.6 * glowIntensity,
+    1.0 * glowIntensity,
+    0.7 * glowIntensity
+  );
+}
+
+export const createExit = (scene: Scene, config: { TILE: number }, i: number, j: number, p: Vector3): Mesh => {
   const exitGroup = makeExit(scene, config);
   exitGroup.position = p.add(new Vector3(0, 0.1, 0));
+  return exitGroup;
 }
\ No newline at end of file
@@ -22,4 +22,8 @@ export const prepareGround = (scene: Scene, config: { W: number, H: number, TILE
         ((H - 1) * TILE) / 2
     );
 
+    // Static geometry under a static light: skip per-frame matrix and material updates
+    ground.freezeWorldMatrix();
+    matFloor.freeze();
+
 }
\ No newline at end of file
@@ -7,4 +7,5 @@ export * from './player';
 export * from './lava';
 export * from './camera';
 export * from './door-auto';
-export * from './button';
\ No newline at end of file
+export * from './button';
+export * from './exit';
\ No newline at end of file
@@ -1,18 +1,18 @@
 import { AbstractMesh, Color3, Mesh, MeshBuilder, Scene, StandardMaterial, Texture, Vector3 } from "@babylonjs/core";
 import { initGifAnimation } from "../gif";
-import { keyOf } from "../keyOf";
+import { CELL_LAVA, Grid, LavaData, TimedLavaData, cellIndex } from "../grid";
 
-export const makeLava = (scene: Scene, config: { TILE: number }) => {
+export const makeLavaUnit = (scene: Scene, config: { TILE: number }) => {
   // Create a simple plane for the lava
   const lavaPlane = MeshBuilder.CreatePlane(
-    `lava`,
+    `lavaUnit`,
     { width: config.TILE, height: config.TILE },
     scene
   );
 
-  // Rotate to lie flat on the ground
+  // Rotate to lie flat on the ground; baked so instances don't need their own rotation
   lavaPlane.rotation.x = Math.PI / 2;
-  lavaPlane.position.y = 0.01; // Slightly above ground to avoid z-fighting
+  lavaPlane.bakeCurrentTransformIntoVertices();
 
   // Create material with animated GIF texture
   const lavaMaterial = new StandardMaterial(`lavaMat`, scene);
@@ -24,16 +24,16 @@ export const makeLava = (scene: Scene, config: { TILE: number }) => {
 
   lavaPlane.material = lavaMaterial;
 
-  // Initialize GIF animation with material reference
+  // Initialize GIF animation once; every lava instance shares this material
   const teardown = initGifAnimation(scene, lavaMaterial, "assets/models/lava.gif");
   lavaPlane.onDisposeObservable.add(() => {
     teardown.then((cb) => {
       cb();
     });
   });
+  lavaPlane.isVisible = false;
 
   return lavaPlane;
-
 }
 
 export const createLava = (
@@ -42,20 +42,32 @@ export const createLava = (
   i: number, 
   j: number, 
   p: Vector3,
+  units: { lavaUnit?: Mesh },
   state: { 
-    lava: Map<string, { mesh: AbstractMesh, interval: number | null, isPassable: boolean }>,
+    grid: Grid,
+    lava: Map<number, LavaData>,
+    timedLava: TimedLavaData[][],
   },
   interval: number | null // 0-9
 ): void => {
-  // Use the existing makeLava function to create the lava mesh
-  const lavaGroup = makeLava(scene, config);
-  lavaGroup.position = p.add(new Vector3(0, 0.01, 0));
+  // Instance the shared lava unit so all lava cells animate from one texture;
+  // it is built on the first lava cell so lava-free levels never start the GIF loop
+  units.lavaUnit ??= makeLavaUnit(scene, config);
+  const lavaGroup = units.lavaUnit.createInstance(`lava_${i}_${j}`);
+  lavaGroup.position = p.add(new Vector3(0, 0.01, 0)); // Slightly above ground to avoid z-fighting
   
   // Store in timed lava collection
-  state.lava.set(keyOf(i, j), {
+  const lavaData: LavaData = {
     mesh: lavaGroup,
     interval: interval,
     isPassable: false
-  });
-  
+  };
+  const index = cellIndex(state.grid, i, j);
+  state.lava.set(index, lavaData);
+  state.grid.cells[index] = CELL_LAVA;
+
+  // Bucket timed lava by interval so each tick only touches its neighbours
+  if (interval !== null) {
+    state.timedLava[interval].push(lavaData as TimedLavaData);
+  }
 }
@@ -1,5 +1,5 @@
-import { Mesh, MeshBuilder, Scene, StandardMaterial, Texture, Vector3 } from "@babylonjs/core";
-import { keyOf } from "../keyOf";
+import { Matrix, Mesh, MeshBuilder, Scene, StandardMaterial, Texture, Vector3 } from "@babylonjs/core";
+import { CELL_WALL, Grid, cellIndex } from "../grid";
 
 type Config = {
   TILE: number;
@@ -20,8 +20,18 @@ export const makeWallUnit = (scene: Scene, config: Config) => {
   return wallUnit;
 }
 
-export const createWall = (config: { WALL_H: number }, i: number, j: number, p: Vector3, units: { wallUnit: Mesh }, state: { blocked: Set<string> }): void => {
-  const inst = units.wallUnit.createInstance(`w_${i}_${j}`);
-  inst.position = p.add(new Vector3(0, config.WALL_H / 2, 0));
-  state.blocked.add(keyOf(i, j));
+export const createWall = (config: { WALL_H: number }, i: number, j: number, p: Vector3, units: { wallUnit: Mesh }, state: { grid: Grid }): void => {
+  // Thin instance: all walls share one draw call, buffer is uploaded once in finalizeWalls
+  units.wallUnit.thinInstanceAdd(Matrix.Translation(p.x, p.y + config.WALL_H / 2, p.z), false);
+  state.grid.cells[cellIndex(state.grid, i, j)] = CELL_WALL;
+}
+
+export const finalizeWalls = (units: { wallUnit: Mesh }): void => {
+  const { wallUnit } = units;
+  if (wallUnit.thinInstanceCount === 0) return;
+  wallUnit.thinInstanceBufferUpdated("matrix");
+  wallUnit.thinInstanceRefreshBoundingInfo();
+  wallUnit.freezeWorldMatrix(); // Walls never move
+  wallUnit.material?.freeze();
+  wallUnit.isVisible = true;
 }
\ No newline at end of file